@@ -6,17 +6,86 @@ This server provides access to Notamify API for retrieving NOTAMs (Notice to Air
 It exposes tools for querying NOTAMs by location, time period, and other parameters.
 """
 
+import asyncio
+import functools
+import math
+import operator
 import os
+import re
+import time
+import weakref
 from datetime import datetime, timezone, timedelta
-from typing import Optional, Any
-from contextlib import asynccontextmanager
-from collections.abc import AsyncIterator
+from typing import Final, Optional, Any
+from contextlib import aclosing, asynccontextmanager
+from dataclasses import dataclass
+from itertools import chain, count
+from collections import Counter, OrderedDict, defaultdict
+from collections.abc import AsyncIterator, Callable
 
 import httpx
+import orjson
 from mcp.server.fastmcp import FastMCP
 from pydantic import BaseModel, Field, field_validator
 
 
+# Upper bound on page requests in flight for a single NOTAM query
+MAX_CONCURRENT_PAGE_REQUESTS = 8
+
+# How long (in seconds) fetched NOTAM pages are reused for an identical query
+NOTAM_CACHE_TTL = 300.0
+# Most queries kept in the cache; the least recently used one is evicted first
+NOTAM_CACHE_MAX_ENTRIES = 128
+# Larger results are streamed without being kept, so they never pin memory
+NOTAM_CACHE_MAX_PAGES = 5
+
+_ICAO_CODE_RE = re.compile(r"[A-Za-z]{4}")
+
+# Display order of affected element types, and sort priority of element effects
+_TYPE_ORDER = (
+    "RUNWAY", "TAXIWAY", "LIGHTING", "SERVICE", "PROCEDURE",
+    "APRON", "APPROACH", "NAVAID", "AIRSPACE", "OTHER"
+)
+_TYPE_ORDER_SET = frozenset(_TYPE_ORDER)
+_EFFECT_PRIORITY = {
+    'CLOSED': 1, 'RESTRICTED': 2, 'HAZARD': 3, 'UNSERVICEABLE': 4,
+    'WORK_IN_PROGRESS': 5, 'CAUTION': 6, 'AFFECTED': 7
+}
+# Orders (effect priority, identifier, input position, element) tuples without
+# comparing elements; the position keeps ties in the order the API returned them
+_ELEMENT_SORT_KEY = operator.itemgetter(0, 1, 2)
+
+# Line prefixes for affected elements in the summary output
+_ELEMENT_PREFIX = "       • "
+_EFFECT_PREFIX = "         Effect: "
+_DETAILS_PREFIX = "         Details: "
+
+
+@functools.lru_cache(maxsize=1024)
+def _validate_icao(locations: tuple[str, ...]) -> tuple[str, ...]:
+    """Validate 1-5 ICAO codes and return them upper-cased"""
+    if not 1 <= len(locations) <= 5:
+        raise ValueError("Between 1 and 5 ICAO codes are required.")
+    validated = []
+    for location in locations:
+        if not _ICAO_CODE_RE.fullmatch(location):
+            raise ValueError(f"Invalid ICAO code: {location}. Must be 4 letters.")
+        validated.append(location.upper())
+    return tuple(validated)
+
+
+def _parse_locations(locations: str) -> list[str]:
+    """Split a comma-separated ICAO code string into upper-cased codes"""
+    return [code for loc in locations.split(",") if (code := loc.strip().upper())]
+
+
+def _iso_z(dt: datetime) -> str:
+    """Format a UTC datetime as YYYY-MM-DDTHH:MM:SSZ without going through strftime"""
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+        f"T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}Z"
+    )
+
+
 class NotamifyConfig(BaseModel):
     """Configuration for Notamify API"""
     
@@ -59,57 +128,148 @@ class NotamQueryParams(BaseModel):
     @field_validator('locations')
     @classmethod
     def validate_icao_codes(cls, v: list[str]) -> list[str]:
-        for location in v:
-            if not location or len(location) != 4 or not location.isalpha():
-                raise ValueError(f"Invalid ICAO code: {location}. Must be 4 letters.")
-        return [loc.upper() for loc in v]
+        return list(_validate_icao(tuple(v)))
 
 
-class AffectedElement(BaseModel):
+@dataclass(slots=True, frozen=True)
+class AffectedElement:
     """Structure for affected elements in NOTAM interpretations"""
     
-    type: str = Field(default="UNKNOWN", description="Element type")
-    identifier: str = Field(default="N/A", description="Element identifier")
-    effect: str = Field(default="N/A", description="Effect on element")
-    details: Optional[str] = Field(None, description="Additional details")
+    type: str = "UNKNOWN"  # Element type
+    identifier: str = "N/A"  # Element identifier
+    effect: str = "N/A"  # Effect on element
+    details: Optional[str] = None  # Additional details
+
+
+def _format_element(element: AffectedElement, write: Callable[[str], Any]) -> None:
+    """Write the display lines for an affected element"""
+    write(f"{_ELEMENT_PREFIX}{element.identifier}")
+    if element.effect != "N/A":
+        write(f"{_EFFECT_PREFIX}{element.effect}")
+    if element.details:
+        write(f"{_DETAILS_PREFIX}{element.details}")
 
 
 class NotamifyMCPClient:
-    """HTTP client for Notamify API"""
+    """HTTP client for Notamify API
+    
+    Create it through get_or_create() so every tool invocation on an event loop
+    reuses the same connection pool. That shared instance stays open for the
+    life of its loop and is closed when the loop shuts down; a client created
+    directly can be closed with close() or used with 'async with'.
+    """
+    
+    # One client per event loop; httpx connections can't cross loops
+    _instances: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, NotamifyMCPClient]" = (
+        weakref.WeakKeyDictionary()
+    )
     
     def __init__(self, config: NotamifyConfig):
         self.config = config
+        # Every page of every query goes to the same host, so keep connections
+        # alive and multiplex concurrent page requests over HTTP/2. Pool
+        # settings live on the transport because httpx ignores the client-level
+        # ones when a custom transport is given.
         self.client = httpx.AsyncClient(
             timeout=30.0,
-            headers=config.headers
+            headers=config.headers,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=50,
+                    keepalive_expiry=30.0
+                ),
+                retries=2
+            )
         )
+        # Task that closes a shared instance at loop shutdown (see get_or_create)
+        self._closer: Optional[asyncio.Task] = None
+        # Fully fetched queries in LRU order: cache key -> (monotonic fetch time, pages)
+        self._cache: OrderedDict[tuple, tuple[float, list[dict[str, Any]]]] = OrderedDict()
+    
+    @classmethod
+    def get_or_create(cls, config: NotamifyConfig) -> "NotamifyMCPClient":
+        """
+        Return the client for the running event loop, creating it on first use
+        
+        Args:
+            config: Configuration used if a new client has to be created
+        
+        Returns:
+            Shared client bound to the current event loop
+        """
+        loop = asyncio.get_running_loop()
+        instance = cls._instances.get(loop)
+        if instance is None or instance.client.is_closed:
+            instance = cls(config)
+            instance._closer = loop.create_task(instance._close_at_loop_shutdown())
+            cls._instances[loop] = instance
+        return instance
+    
+    async def _close_at_loop_shutdown(self) -> None:
+        """Wait until cancelled, then close the HTTP client
+        
+        asyncio.run() (and so FastMCP.run()) cancels every remaining task before
+        closing the loop, which makes this the loop's shutdown hook.
+        """
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await self.close()
     
     async def close(self):
         """Close the HTTP client"""
         await self.client.aclose()
     
-    async def get_notams(
+    async def __aenter__(self) -> "NotamifyMCPClient":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+    
+    def _cached_pages(self, key: tuple) -> Optional[list[dict[str, Any]]]:
+        """Return the cached pages for a query, or None if missing or expired"""
+        cached = self._cache.get(key)
+        if cached is None:
+            return None
+        if time.monotonic() - cached[0] >= NOTAM_CACHE_TTL:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return cached[1]
+    
+    def _cache_pages(self, key: tuple, pages: list[dict[str, Any]]) -> None:
+        """Remember the pages of a fully fetched query, evicting the oldest entries"""
+        self._cache[key] = (time.monotonic(), pages)
+        self._cache.move_to_end(key)
+        while len(self._cache) > NOTAM_CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
+    
+    async def _iter_pages(
         self,
         locations: list[str],
         starts_at: Optional[str] = None,
         ends_at: Optional[str] = None,
         notam_ids: Optional[list[str]] = None
-    ) -> dict[str, Any]:
+    ) -> AsyncIterator[dict[str, Any]]:
         """
-        Retrieve all NOTAMs from the Notamify API (automatically fetches all pages)
+        Yield decoded API responses page by page, in page order
+        
+        Identical queries within NOTAM_CACHE_TTL are served from the cache, so
+        callers must treat the yielded pages as read-only. Results longer than
+        NOTAM_CACHE_MAX_PAGES pages are not cached.
         
         Args:
             locations: List of 4-character ICAO airport codes (max 5)
             starts_at: Start date (YYYY-MM-DDTHH:MM:SSZ format)
             ends_at: End date (YYYY-MM-DDTHH:MM:SSZ format)
             notam_ids: List of specific NOTAM IDs
-        
-        Returns:
-            Dictionary containing all NOTAMs data from all pages
         """
-        # Validate and create query parameters
-        query_params = NotamQueryParams(
-            locations=locations,
+        # Validate locations through the cached helper and build the params
+        # without re-running the model validators on every query
+        query_params = NotamQueryParams.model_construct(
+            locations=list(_validate_icao(tuple(locations))),
             starts_at=starts_at,
             ends_at=ends_at,
             notam_ids=notam_ids
@@ -121,8 +281,7 @@ class NotamifyMCPClient:
         }
         
         # Add locations
-        for location in query_params.locations:
-            base_params.setdefault("location", []).append(location)
+        base_params["location"] = list(query_params.locations)
         
         # Add time filters
         if query_params.starts_at:
@@ -132,65 +291,182 @@ class NotamifyMCPClient:
         
         # Add NOTAM IDs if specified
         if query_params.notam_ids:
-            for notam_id in query_params.notam_ids:
-                base_params.setdefault("notam_ids", []).append(notam_id)
+            base_params["notam_ids"] = list(query_params.notam_ids)
         
-        # Fetch all pages
+        cache_key = (
+            tuple(sorted(query_params.locations)),
+            query_params.starts_at,
+            query_params.ends_at,
+            tuple(query_params.notam_ids or ())
+        )
+        cached = self._cached_pages(cache_key)
+        if cached is not None:
+            for data in cached:
+                yield data
+            return
+        
+        # Encode the shared parameters once; each page only adds its number
+        base_query = httpx.QueryParams(base_params)
+        url = f"{self.config.base_url}/notams"
+        
+        # Fetch the first page to learn the total result size
+        response = await self.client.get(url, params=base_query.merge({"page": 1}))
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        
+        # The first page tells us exactly how many more pages to request
+        expected_pages = max(1, math.ceil(data.get("total_count", 0) / query_params.per_page))
+        # Keep pages for the cache only when the result is small enough to store
+        pages = [data] if expected_pages <= NOTAM_CACHE_MAX_PAGES else None
+        if expected_pages == 1:
+            if pages is not None:
+                self._cache_pages(cache_key, pages)
+            yield data
+            return
+        
+        page_params = [
+            base_query.merge({"page": page})
+            for page in range(2, expected_pages + 1)
+        ]
+        
+        # Fetch the remaining pages concurrently, bounded to avoid flooding the API
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGE_REQUESTS)
+        
+        async def fetch_page(params: httpx.QueryParams) -> httpx.Response:
+            async with semaphore:
+                return await self.client.get(url, params=params)
+        
+        # Start every remaining request up front and consume them in page order,
+        # so each page is processed while later pages are still in flight
+        tasks = [asyncio.create_task(fetch_page(params)) for params in page_params]
+        try:
+            yield data
+            for task in tasks:
+                response = await task
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+                if pages is not None:
+                    pages.append(data)
+                yield data
+        finally:
+            # Don't leave prefetched requests running if a page failed
+            # or the consumer stopped early
+            for task in tasks:
+                task.cancel()
+        
+        # Only complete results are cached
+        if pages is not None:
+            self._cache_pages(cache_key, pages)
+    
+    async def iter_notams(
+        self,
+        locations: list[str],
+        starts_at: Optional[str] = None,
+        ends_at: Optional[str] = None,
+        notam_ids: Optional[list[str]] = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Yield NOTAMs from the Notamify API as each page arrives
+        
+        Args:
+            locations: List of 4-character ICAO airport codes (max 5)
+            starts_at: Start date (YYYY-MM-DDTHH:MM:SSZ format)
+            ends_at: End date (YYYY-MM-DDTHH:MM:SSZ format)
+            notam_ids: List of specific NOTAM IDs
+        
+        Yields:
+            Individual NOTAM dictionaries, in API order across all pages
+        """
+        # Close the page generator as soon as this one is closed, so its
+        # prefetch tasks are cancelled immediately
+        async with aclosing(self._iter_pages(locations, starts_at, ends_at, notam_ids)) as pages:
+            async for data in pages:
+                for notam in data.get("notams", []):
+                    yield notam
+    
+    async def _fetch_all(
+        self,
+        locations: list[str],
+        starts_at: Optional[str] = None,
+        ends_at: Optional[str] = None,
+        notam_ids: Optional[list[str]] = None
+    ) -> dict[str, Any]:
+        """Fetch every page of a single API query and combine them into one result"""
         all_notams = []
-        page = 1
         total_count = None
         
-        while True:
-            # Add current page to params
-            params = base_params.copy()
-            params["page"] = page
-            
-            response = await self.client.get(
-                f"{self.config.base_url}/notams",
-                params=params
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            # Get pagination info from current response
-            total_count = data.get("total_count", 0)
-            
-            # Add NOTAMs from this page
-            page_notams = data.get("notams", [])
-            all_notams.extend(page_notams)
-            
-            # Check if we have collected all NOTAMs
-            # Break if we've collected all items or no more NOTAMs on this page
-            if len(all_notams) >= total_count or not page_notams:
-                break
-            
-            page += 1
+        async with aclosing(self._iter_pages(locations, starts_at, ends_at, notam_ids)) as pages:
+            async for data in pages:
+                if total_count is None:
+                    total_count = data.get("total_count", 0)
+                all_notams.extend(data.get("notams", []))
+        
+        # Return combined result with updated pagination info. The last
+        # response is copied, not updated in place, because it may be cached.
+        return {
+            **data,
+            "notams": all_notams,
+            "total_count": total_count,
+            "page": 1,  # Reset to indicate this is a combined result
+            "per_page": len(all_notams)  # Show actual number returned
+        }
+    
+    async def get_notams(
+        self,
+        locations: list[str],
+        starts_at: Optional[str] = None,
+        ends_at: Optional[str] = None,
+        notam_ids: Optional[list[str]] = None,
+        per_location: bool = False
+    ) -> dict[str, Any]:
+        """
+        Retrieve all NOTAMs from the Notamify API (automatically fetches all pages)
+        
+        Args:
+            locations: List of 4-character ICAO airport codes (max 5)
+            starts_at: Start date (YYYY-MM-DDTHH:MM:SSZ format)
+            ends_at: End date (YYYY-MM-DDTHH:MM:SSZ format)
+            notam_ids: List of specific NOTAM IDs
+            per_location: Query each airport separately and concurrently, so
+                airports with few NOTAMs don't wait behind the pages of busy ones
         
-        # Return combined result with updated pagination info
-        result = data.copy()  # Use last response as base
-        result["notams"] = all_notams
-        result["total_count"] = total_count
-        result["page"] = 1  # Reset to indicate this is a combined result
-        result["per_page"] = len(all_notams)  # Show actual number returned
+        Returns:
+            Dictionary containing all NOTAMs data from all pages
+        """
+        if not per_location or len(locations) < 2:
+            return await self._fetch_all(locations, starts_at, ends_at, notam_ids)
+        
+        # Validate the whole request up front; each sub-query only sees one code
+        unique_locations = dict.fromkeys(_validate_icao(tuple(locations)))
+        results = await asyncio.gather(*(
+            self._fetch_all([location], starts_at, ends_at, notam_ids)
+            for location in unique_locations
+        ))
         
-        return result
+        all_notams = list(chain.from_iterable(result["notams"] for result in results))
+        return {
+            **results[-1],
+            "notams": all_notams,
+            "total_count": sum(result["total_count"] for result in results),
+            "per_page": len(all_notams)
+        }
 
 
 # Application context for dependency injection
 class AppContext:
     def __init__(self):
         self.config = NotamifyConfig()
-        self.client = NotamifyMCPClient(self.config)
+        # Tools must use this shared client rather than creating their own
+        self.client = NotamifyMCPClient.get_or_create(self.config)
 
 
 @asynccontextmanager
 async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
     """Manage application lifecycle with initialized Notamify client"""
-    context = AppContext()
-    try:
-        yield context
-    finally:
-        await context.client.close()
+    # FastMCP enters the lifespan per session (and per request for stateless
+    # HTTP), so the shared client is not closed here: it stays open, with its
+    # connection pool and cache, until the event loop shuts down
+    yield AppContext()
 
 
 # Initialize FastMCP server
@@ -206,7 +482,8 @@ async def get_notams(
     locations: str,
     starts_at: Optional[str] = None,
     ends_at: Optional[str] = None,
-    hours_from_now: int = 24
+    hours_from_now: int = 24,
+    per_location: bool = False
 ) -> str:
     """
     Retrieve all NOTAMs for specified airports and time period (automatically fetches all pages)
@@ -216,13 +493,15 @@ async def get_notams(
                   Examples: "KJFK", "EGLL,EDDM", "KJFK,KLAX,KORD"
         starts_at: Start date in ISO 8601 format (YYYY-MM-DDTHH:MM:SSZ).
                   Cannot be earlier than 1 day before current UTC time.
-                  If not provided, uses current time.
+                  If not provided, uses current time (rounded down to the minute).
                   Example: "2024-01-01T00:00:00Z"
         ends_at: End date in ISO 8601 format (YYYY-MM-DDTHH:MM:SSZ).
                 Must be later than starts_at.
                 If not provided, uses current time + hours_from_now.
                 Example: "2024-01-01T23:59:59Z"
         hours_from_now: Number of hours from current time to query if ends_at not provided (default: 24)
+        per_location: Query each airport separately and in parallel (default: False).
+                     Faster when one airport has many more NOTAMs than the others.
     
     Returns:
         JSON string containing all NOTAMs data with interpretations (all pages combined)
@@ -231,26 +510,28 @@ async def get_notams(
     client = context.request_context.lifespan_context.client
     
     # Parse locations
-    location_list = [loc.strip().upper() for loc in locations.split(",") if loc.strip()]
+    location_list = _parse_locations(locations)
     
     # Generate time range if not provided
     if not starts_at or not ends_at:
-        now = datetime.now(timezone.utc)
+        # Whole minutes, so repeated default queries can share a cache entry
+        now = datetime.now(timezone.utc).replace(second=0, microsecond=0)
         if not starts_at:
-            starts_at = now.strftime("%Y-%m-%dT%H:%M:%SZ")
+            starts_at = _iso_z(now)
         if not ends_at:
-            ends_at = (now + timedelta(hours=hours_from_now)).strftime("%Y-%m-%dT%H:%M:%SZ")
+            ends_at = _iso_z(now + timedelta(hours=hours_from_now))
     
     result = await client.get_notams(
         locations=location_list,
         starts_at=starts_at,
         ends_at=ends_at,
-        notam_ids=None
+        notam_ids=None,
+        per_location=per_location
     )
     
-    # Format response for better readability
-    import json
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    # Format response for better readability. Everything in the result was
+    # decoded from JSON, so keys are always strings and need no conversion.
+    return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
 
 
 @mcp.tool()
@@ -267,7 +548,7 @@ async def get_affected_elements(
         locations: Comma-separated list of 4-character ICAO airport codes (max 5).
                   Examples: "KJFK", "EGLL,EDDM", "KJFK,KLAX,KORD"
         starts_at: Start date in ISO 8601 format (YYYY-MM-DDTHH:MM:SSZ).
-                  If not provided, uses current time.
+                  If not provided, uses current time (rounded down to the minute).
         ends_at: End date in ISO 8601 format (YYYY-MM-DDTHH:MM:SSZ).
                 If not provided, uses current time + hours_from_now.
         hours_from_now: Number of hours from current time to query if ends_at not provided (default: 24)
@@ -279,114 +560,92 @@ async def get_affected_elements(
     client = context.request_context.lifespan_context.client
     
     # Parse locations
-    location_list = [loc.strip().upper() for loc in locations.split(",") if loc.strip()]
+    location_list = _parse_locations(locations)
     
     # Generate time range if not provided
     if not starts_at or not ends_at:
-        now = datetime.now(timezone.utc)
+        # Whole minutes, so repeated default queries can share a cache entry
+        now = datetime.now(timezone.utc).replace(second=0, microsecond=0)
         if not starts_at:
-            starts_at = now.strftime("%Y-%m-%dT%H:%M:%SZ")
+            starts_at = _iso_z(now)
         if not ends_at:
-            ends_at = (now + timedelta(hours=hours_from_now)).strftime("%Y-%m-%dT%H:%M:%SZ")
-    
-    result = await client.get_notams(
-        locations=location_list,
-        starts_at=starts_at,
-        ends_at=ends_at,
-        notam_ids=None
-    )
-    
-    notams = result.get("notams", [])
-    if not notams:
-        return f"No active NOTAMs found for {locations} in the specified time period."
+            ends_at = _iso_z(now + timedelta(hours=hours_from_now))
     
     # Collect and organize affected elements
     affected_summary = {
         "airports": {},
-        "total_notams": len(notams),
-        "elements_by_category": {},
+        "total_notams": 0,
+        "elements_by_category": Counter(),
         "map_elements": [],
         "time_period": f"{starts_at} to {ends_at}"
     }
     
-    def format_element(element: AffectedElement) -> str:
-        """Format an affected element for display"""
-        lines = [f"       • {element.identifier}"]
-        if element.effect != "N/A":
-            lines.append(f"         Effect: {element.effect}")
-        if element.details:
-            lines.append(f"         Details: {element.details}")
-        return "\n".join(lines)
-    
-    def sort_elements(elements: list[dict[str, Any]]) -> list[AffectedElement]:
-        """Sort elements by type and effect priority"""
-        type_priority = {
-            'RUNWAY': 1, 'TAXIWAY': 2, 'LIGHTING': 3, 'SERVICE': 4, 'PROCEDURE': 5,
-            'APRON': 6, 'APPROACH': 7, 'NAVAID': 8, 'AIRSPACE': 9, 'OTHER': 10
-        }
-        effect_priority = {
-            'CLOSED': 1, 'RESTRICTED': 2, 'HAZARD': 3, 'UNSERVICEABLE': 4,
-            'WORK_IN_PROGRESS': 5, 'CAUTION': 6, 'AFFECTED': 7
-        }
-        
-        def sort_key(element: dict[str, Any]) -> tuple[int, int, str]:
-            elem_type = element.get("type", "OTHER")
-            effect = element.get("effect", "AFFECTED")
-            identifier = element.get("identifier", "")
-            
-            return (
-                type_priority.get(elem_type, 99),
-                effect_priority.get(effect, 99),
-                identifier.upper()
-            )
-        
-        sorted_elements = sorted(elements, key=sort_key)
-        return [AffectedElement(**elem) for elem in sorted_elements]
+    # Position of each element in the API response, used to break sort ties
+    element_position = count()
     
-    for notam in notams:
-        icao_code = notam.get('icao_code', 'UNKNOWN')
-        notam_id = notam.get('id', 'N/A')
-        
-        # Initialize airport in summary if not exists
-        if icao_code not in affected_summary["airports"]:
-            affected_summary["airports"][icao_code] = {
-                "notam_count": 0,
-                "affected_elements": [],
-                "categories": set(),
-                "map_elements": []
-            }
-        
-        affected_summary["airports"][icao_code]["notam_count"] += 1
-        
-        interpretation = notam.get('interpretation', {})
-        if interpretation:
-            category = interpretation.get('category', 'UNSPECIFIED')
-            affected_summary["airports"][icao_code]["categories"].add(category)
+    # Fold NOTAMs into the summary as pages arrive rather than after the last one.
+    # aclosing() cancels any outstanding page requests right away if this loop raises.
+    async with aclosing(client.iter_notams(
+        locations=location_list,
+        starts_at=starts_at,
+        ends_at=ends_at,
+        notam_ids=None
+    )) as notams:
+        async for notam in notams:
+            affected_summary["total_notams"] += 1
+            icao_code = notam.get('icao_code', 'UNKNOWN')
+            notam_id = notam.get('id', 'N/A')
             
-            # Count elements by category
-            if category not in affected_summary["elements_by_category"]:
-                affected_summary["elements_by_category"][category] = 0
-            affected_summary["elements_by_category"][category] += 1
+            # Initialize airport in summary if not exists
+            if icao_code not in affected_summary["airports"]:
+                affected_summary["airports"][icao_code] = {
+                    "notam_count": 0,
+                    # (effect priority, identifier, input position, element) tuples per element type
+                    "elements_by_type": defaultdict(list),
+                    "categories": [],
+                    "map_elements": []
+                }
             
-            # Extract affected elements - fix potential None values
-            affected_elements = interpretation.get('affected_elements') or []
-            if affected_elements:
-                # Handle structured format (AffectedElementDTO objects)
-                for element in affected_elements:
-                    element_info = {
-                        "type": element.get("type", "UNKNOWN"),
-                        "identifier": element.get("identifier", "N/A"),
-                        "effect": element.get("effect", "N/A"),
-                        "details": element.get("details")
-                    }
-                    affected_summary["airports"][icao_code]["affected_elements"].append(element_info)
+            affected_summary["airports"][icao_code]["notam_count"] += 1
             
+            interpretation = notam.get('interpretation', {})
+            if interpretation:
+                category = interpretation.get('category', 'UNSPECIFIED')
+                # Airports see only a handful of distinct categories, so a short
+                # list is cheaper than a set here
+                categories = affected_summary["airports"][icao_code]["categories"]
+                if category not in categories:
+                    categories.append(category)
+                
+                # Count elements by category
+                affected_summary["elements_by_category"][category] += 1
+                
+                # Extract affected elements - fix potential None values
+                affected_elements = interpretation.get('affected_elements') or []
+                if affected_elements:
+                    elements_by_type = affected_summary["airports"][icao_code]["elements_by_type"]
+                    # Handle structured format (AffectedElementDTO objects)
+                    for element in affected_elements:
+                        element_info = AffectedElement(
+                            element.get("type", "UNKNOWN"),
+                            element.get("identifier", "N/A"),
+                            element.get("effect", "N/A"),
+                            element.get("details")
+                        )
+                        elements_by_type[element_info.type].append((
+                            _EFFECT_PRIORITY.get(element_info.effect, 99),
+                            element_info.identifier.upper(),
+                            next(element_position),
+                            element_info
+                        ))
+    
+    if not affected_summary["total_notams"]:
+        return f"No active NOTAMs found for {locations} in the specified time period."
     
-    # Sort affected elements for each airport
-    for icao_code in affected_summary["airports"]:
-        affected_summary["airports"][icao_code]["affected_elements"] = sort_elements(
-            affected_summary["airports"][icao_code]["affected_elements"]
-        )
+    # Sort each airport's elements within their type by effect priority and identifier
+    for airport_data in affected_summary["airports"].values():
+        for elements in airport_data["elements_by_type"].values():
+            elements.sort(key=_ELEMENT_SORT_KEY)
     
     # Format the output
     output_lines = []
@@ -401,8 +660,8 @@ async def get_affected_elements(
     # Summary by category
     if affected_summary["elements_by_category"]:
         output_lines.append("NOTAM Categories:")
-        for category, count in sorted(affected_summary["elements_by_category"].items()):
-            output_lines.append(f"  • {category}: {count} NOTAMs")
+        for category, category_count in sorted(affected_summary["elements_by_category"].items()):
+            output_lines.append(f"  • {category}: {category_count} NOTAMs")
         output_lines.append("")
     
     # Detailed breakdown by airport
@@ -412,34 +671,21 @@ async def get_affected_elements(
         output_lines.append(f"   Categories: {', '.join(sorted(airport_data['categories']))}")
         
         # Show affected elements if any
-        if airport_data["affected_elements"]:
+        elements_by_type = airport_data["elements_by_type"]
+        if elements_by_type:
             output_lines.append("   Affected Elements (sorted by priority):")
             
-            # Group already sorted elements by their type
-            elements_by_type: dict[str, list[AffectedElement]] = {}
-            for element in airport_data["affected_elements"]:
-                elem_type = element.type
-                
-                if elem_type not in elements_by_type:
-                    elements_by_type[elem_type] = []
-                elements_by_type[elem_type].append(element)
-            
-            # Display elements by type in priority order
-            type_order = ["RUNWAY", "TAXIWAY", "LIGHTING", "SERVICE", "PROCEDURE", 
-                         "APRON", "APPROACH", "NAVAID", "AIRSPACE", "OTHER"]
-            
-            for elem_type in type_order:
+            # Display elements by type in priority order, followed by any
+            # remaining types ordered by their highest-priority element
+            remaining_types = sorted(
+                (elem_type for elem_type in elements_by_type if elem_type not in _TYPE_ORDER_SET),
+                key=lambda elem_type: _ELEMENT_SORT_KEY(elements_by_type[elem_type][0])
+            )
+            for elem_type in (*_TYPE_ORDER, *remaining_types):
                 if elem_type in elements_by_type:
                     output_lines.append(f"     {elem_type}:")
-                    for element in elements_by_type[elem_type]:
-                        output_lines.append(format_element(element))
-            
-            # Display any remaining types not in the predefined order
-            for elem_type, elements in elements_by_type.items():
-                if elem_type not in type_order:
-                    output_lines.append(f"     {elem_type}:")
-                    for element in elements:
-                        output_lines.append(format_element(element))
+                    for *_, element in elements_by_type[elem_type]:
+                        _format_element(element, output_lines.append)
         
         output_lines.append("")
     
@@ -447,15 +693,7 @@ async def get_affected_elements(
 
 
 
-@mcp.resource("config://api")
-def get_api_info() -> str:
-    """
-    Get information about the Notamify API configuration and usage
-    
-    Returns:
-        API configuration and usage information
-    """
-    return """
+_API_INFO: Final[str] = """
 Notamify API Configuration:
 ==========================
 
@@ -484,19 +722,19 @@ Common ICAO codes:
 """
 
 
-@mcp.prompt()
-def analyze_notams(airport_codes: str) -> str:
+@mcp.resource("config://api")
+def get_api_info() -> str:
     """
-    Generate a prompt for analyzing NOTAMs at specified airports
-    
-    Args:
-        airport_codes: Comma-separated ICAO airport codes
+    Get information about the Notamify API configuration and usage
     
     Returns:
-        Formatted prompt for NOTAM analysis
+        API configuration and usage information
     """
-    return f"""
-Please analyze the current NOTAMs for the following airports: {airport_codes}
+    return _API_INFO
+
+
+_ANALYZE_TEMPLATE: Final[str] = """
+Please analyze the current NOTAMs for the following airports: {airports}
 
 Use the get_notams tool to retrieve current NOTAM data and then provide:
 
@@ -510,6 +748,28 @@ Focus on operationally significant information that pilots and flight planners n
 """
 
 
+@mcp.prompt()
+def analyze_notams(airport_codes: str) -> str:
+    """
+    Generate a prompt for analyzing NOTAMs at specified airports
+    
+    Args:
+        airport_codes: Comma-separated ICAO airport codes
+    
+    Returns:
+        Formatted prompt for NOTAM analysis
+    """
+    return _ANALYZE_TEMPLATE.format(airports=airport_codes)
+
+
 if __name__ == "__main__":
+    # Use the faster libuv-based event loop when the optional uvloop extra is
+    # installed; otherwise (e.g. on Windows) keep the default asyncio loop
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     # Run the server
     mcp.run() 
\ No newline at end of file
@@ -0,0 +1,103 @@
+"""Tests for the in-process NOTAM page cache"""
+
+import httpx
+import pytest
+
+import notamify_server
+from notamify_server import NotamifyConfig, NotamifyMCPClient
+
+
+STARTS_AT = "2024-01-01T00:00:00Z"
+ENDS_AT = "2024-01-02T00:00:00Z"
+
+
+@pytest.fixture
+def requests() -> list[httpx.Request]:
+    return []
+
+
+@pytest.fixture
+async def client(requests: list[httpx.Request]):
+    """Client whose API calls are answered locally with one NOTAM per location"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        notams = [
+            {"id": f"{location}-1", "icao_code": location}
+            for location in request.url.params.get_list("location")
+        ]
+        return httpx.Response(200, json={"notams": notams, "total_count": len(notams)})
+
+    notamify_client = NotamifyMCPClient(NotamifyConfig(api_key="test-key"))
+    await notamify_client.client.aclose()
+    notamify_client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    async with notamify_client:
+        yield notamify_client
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Controllable replacement for time.monotonic; set clock[0] to move time"""
+    now = [1000.0]
+    monkeypatch.setattr(notamify_server.time, "monotonic", lambda: now[0])
+    return now
+
+
+async def test_identical_query_is_served_from_cache(client, requests, clock):
+    first = await client.get_notams(["KJFK", "EGLL"], STARTS_AT, ENDS_AT)
+    # Same query with locations in a different order and case
+    second = await client.get_notams(["egll", "KJFK"], STARTS_AT, ENDS_AT)
+
+    assert len(requests) == 1
+    assert second == first
+
+    streamed = [notam async for notam in client.iter_notams(["KJFK", "EGLL"], STARTS_AT, ENDS_AT)]
+    assert len(requests) == 1
+    assert streamed == first["notams"]
+
+
+async def test_different_window_is_not_served_from_cache(client, requests, clock):
+    await client.get_notams(["KJFK"], STARTS_AT, ENDS_AT)
+    await client.get_notams(["KJFK"], STARTS_AT, "2024-01-03T00:00:00Z")
+
+    assert len(requests) == 2
+
+
+async def test_cached_entry_expires_after_ttl(client, requests, clock):
+    await client.get_notams(["KJFK"], STARTS_AT, ENDS_AT)
+
+    clock[0] += notamify_server.NOTAM_CACHE_TTL - 1
+    await client.get_notams(["KJFK"], STARTS_AT, ENDS_AT)
+    assert len(requests) == 1
+
+    clock[0] += 1
+    await client.get_notams(["KJFK"], STARTS_AT, ENDS_AT)
+    assert len(requests) == 2
+
+
+async def test_cache_evicts_least_recently_used_entry(client, requests, clock, monkeypatch):
+    monkeypatch.setattr(notamify_server, "NOTAM_CACHE_MAX_ENTRIES", 2)
+
+    await client.get_notams(["KJFK"], STARTS_AT, ENDS_AT)
+    await client.get_notams(["EGLL"], STARTS_AT, ENDS_AT)
+    # Touch KJFK so EGLL becomes the least recently used entry
+    await client.get_notams(["KJFK"], STARTS_AT, ENDS_AT)
+    await client.get_notams(["EDDM"], STARTS_AT, ENDS_AT)
+    assert len(requests) == 3
+    assert len(client._cache) == 2
+
+    await client.get_notams(["KJFK"], STARTS_AT, ENDS_AT)
+    assert len(requests) == 3
+
+    await client.get_notams(["EGLL"], STARTS_AT, ENDS_AT)
+    assert len(requests) == 4
+
+
+async def test_results_over_page_limit_are_not_cached(client, requests, clock, monkeypatch):
+    monkeypatch.setattr(notamify_server, "NOTAM_CACHE_MAX_PAGES", 0)
+
+    await client.get_notams(["KJFK"], STARTS_AT, ENDS_AT)
+    await client.get_notams(["KJFK"], STARTS_AT, ENDS_AT)
+
+    assert len(requests) == 2
+    assert not client._cache